@@ -3,16 +3,129 @@
 
 import sys
 import subprocess
+import functools
 import json
 import os
 import math
+import re
+import shutil
 import wave
 import struct
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Shared ffmpeg invocation prefix: no stdin, no banner, and tight probe limits
+# — stream probing otherwise adds fixed startup latency to every pass, which
+# dominates for short files. astats/loudnorm summaries still print at info.
+_FFMPEG = [
+    "ffmpeg", "-nostdin", "-hide_banner", "-loglevel", "info",
+    "-probesize", "32k", "-analyzeduration", "0",
+]
+
+# Matches the per-filter prefix ffmpeg puts on every astats summary line,
+# e.g. "[Parsed_astats_3 @ 0x...] RMS level dB: -23.4"
+_ASTATS_BLOCK_RE = re.compile(r"\[Parsed_astats_(\d+) @")
+
+# One pass over the whole stderr buffer instead of a Python loop per line
+_ASTATS_FIELD_RE = re.compile(
+    r"(RMS level dB|Peak level dB|Crest factor|Flat factor|Dynamic range):"
+    r"\s*(-?(?:inf|nan|\d+(?:\.\d+)?))"
+)
+
+# ffmpeg's input header on stderr, e.g.
+#   Duration: 00:03:25.40, start: 0.000000, bitrate: 320 kb/s
+#   Stream #0:0: Audio: mp3, 44100 Hz, stereo, fltp, 320 kb/s
+_DURATION_RE = re.compile(
+    r"Duration: (\d+):(\d+):(\d+(?:\.\d+)?)(?:, start: [^,]*)?, bitrate: (\d+) kb/s"
+)
+_STREAM_RE = re.compile(r"Stream #\d+:\d+[^:]*: Audio: (\w+)[^,]*, (\d+) Hz, ([^,]+)")
+# ffmpeg only prints "(N bit)" when the raw depth differs from the sample
+# format, e.g. "s32 (24 bit)"; for plain PCM the depth is in the codec
+# name itself ("pcm_s16le" → 16), matching what ffprobe would report.
+_BIT_DEPTH_RE = re.compile(r"\((\d+) bit\)")
+_PCM_BITS_RE = re.compile(r"^pcm_[fsu](\d+)")
+
+_SPECTRAL_BANDS = [
+    ("Sub", 20, 60),
+    ("Low Bass", 60, 150),
+    ("Mid Bass", 150, 300),
+    ("Low Mids", 300, 600),
+    ("Mids", 600, 1200),
+    ("Upper Mids", 1200, 3000),
+    ("Presence", 3000, 6000),
+    ("Brilliance", 6000, 12000),
+    ("Air", 12000, 20000),
+]
+
+
+def _max_workers():
+    """Worker count for parallel ffmpeg passes. Override with ANALYZE_PARALLELISM."""
+    try:
+        n = int(os.environ.get("ANALYZE_PARALLELISM", "0"))
+    except ValueError:
+        n = 0
+    if n > 0:
+        return n
+    return os.cpu_count() or 4
+
+
+# ffmpeg writes its analysis summaries at the end of the log, so only the
+# last chunk of output ever needs decoding into a Python str.
+_OUTPUT_TAIL = 64 * 1024
+
+
+def _run(cmd):
+    """Run a command and return the tail of its stderr (ffmpeg writes analysis output there)."""
+    proc = subprocess.Popen(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+    _, err = proc.communicate()
+    return err[-_OUTPUT_TAIL:].decode("utf-8", "replace")
 
 
 def get_audio_info(path):
-    """Get basic audio file info using ffprobe."""
+    """Get basic audio file info, mined from the cached astats pass header."""
+    header = _astats_pass(path)[1]
+    dur_m = _DURATION_RE.search(header)
+    stream_m = _STREAM_RE.search(header)
+    if dur_m and stream_m:
+        hours, mins, secs, bitrate = dur_m.groups()
+        duration = int(hours) * 3600 + int(mins) * 60 + float(secs)
+        codec, rate, layout = stream_m.groups()
+        layout = layout.split("(")[0].strip()
+        channels = {"mono": 1, "stereo": 2}.get(layout)
+        if channels is None:
+            digits = re.findall(r"\d+", layout)
+            channels = sum(int(d) for d in digits) if digits else 2
+        stream = {
+            "codec_type": "audio",
+            "codec_name": codec,
+            "sample_rate": rate,
+            "channels": channels,
+        }
+        # Bit depth, restricted to the rest of the Stream line
+        line_end = header.find("\n", stream_m.end())
+        if line_end == -1:
+            line_end = len(header)
+        bit_m = _BIT_DEPTH_RE.search(header, stream_m.end(), line_end)
+        if bit_m:
+            stream["bits_per_raw_sample"] = bit_m.group(1)
+        else:
+            pcm_m = _PCM_BITS_RE.match(codec)
+            if pcm_m:
+                stream["bits_per_raw_sample"] = pcm_m.group(1)
+        return {
+            "format": {"duration": str(duration), "bit_rate": str(int(bitrate) * 1000)},
+            "streams": [stream],
+        }
+    return _ffprobe_info(path)
+
+
+def _ffprobe_info(path):
+    """Fallback: full stream info via a dedicated ffprobe call."""
     cmd = [
         "ffprobe", "-v", "quiet", "-print_format", "json",
         "-show_format", "-show_streams", path
@@ -25,14 +138,13 @@ def get_audio_info(path):
 
 def get_loudness(path):
     """Get LUFS, true peak, and loudness range using ffmpeg loudnorm filter."""
-    cmd = [
-        "ffmpeg", "-i", path, "-af",
+    cmd = _FFMPEG + [
+        "-i", path, "-af",
         "loudnorm=I=-14:TP=-1:LRA=11:print_format=json",
         "-f", "null", "-"
     ]
-    result = subprocess.run(cmd, capture_output=True, text=True)
     # loudnorm outputs JSON to stderr
-    output = result.stderr
+    output = _run(cmd)
     # Find the JSON block in the output
     json_start = output.rfind("{")
     json_end = output.rfind("}") + 1
@@ -45,101 +157,242 @@ def get_loudness(path):
 
 
 def get_spectral_balance(path):
-    """Get energy in frequency bands using ffmpeg's astats and multiple bandpass filters."""
-    bands = [
-        ("Sub", 20, 60),
-        ("Low Bass", 60, 150),
-        ("Mid Bass", 150, 300),
-        ("Low Mids", 300, 600),
-        ("Mids", 600, 1200),
-        ("Upper Mids", 1200, 3000),
-        ("Presence", 3000, 6000),
-        ("Brilliance", 6000, 12000),
-        ("Air", 12000, 20000),
-    ]
+    """Get energy in frequency bands, in dB per band."""
+    if np is None:
+        return _spectral_balance_ffmpeg(path)
+
+    # Decode once to mono float32 PCM and compute the band energies from a
+    # single FFT in-process — no per-band filters and no stderr parsing.
+    rate = 44100
+    proc = subprocess.Popen(
+        _FFMPEG + ["-i", path, "-f", "f32le", "-ac", "1", "-ar", str(rate), "-"],
+        stdout=subprocess.PIPE, stderr=subprocess.DEVNULL
+    )
+    raw = proc.stdout.read()
+    proc.wait()
+    pcm = np.frombuffer(raw, dtype=np.float32)
+    if pcm.size == 0:
+        return _spectral_balance_ffmpeg(path)
+
+    spectrum = np.fft.rfft(pcm)
+    power = np.abs(spectrum) ** 2
+    freqs = np.fft.rfftfreq(pcm.size, 1.0 / rate)
 
     results = {}
-    for name, low, high in bands:
-        cmd = [
-            "ffmpeg", "-i", path, "-af",
-            f"highpass=f={low},lowpass=f={high},astats=metadata=1:reset=0",
-            "-f", "null", "-"
-        ]
-        result = subprocess.run(cmd, capture_output=True, text=True)
-        output = result.stderr
-        # Extract RMS level from astats output
-        for line in output.split("\n"):
-            if "RMS level dB" in line and "Overall" in line:
-                try:
-                    val = line.split("RMS level dB:")[1].strip()
-                    results[name] = float(val)
-                except (IndexError, ValueError):
-                    pass
-                break
-            elif "RMS level dB:" in line:
-                try:
-                    val = line.split("RMS level dB:")[1].strip()
-                    results[name] = float(val)
-                except (IndexError, ValueError):
-                    pass
+    n = pcm.size
+    for name, low, high in _SPECTRAL_BANDS:
+        band_power = float(power[(freqs >= low) & (freqs < high)].sum())
+        # Parseval: mean square of the band-limited signal, expressed in dB
+        # like astats' "RMS level dB" so the output format is unchanged.
+        rms_sq = 2.0 * band_power / (n * n)
+        results[name] = 10 * math.log10(rms_sq) if rms_sq > 0 else -120.0
 
     return results
 
 
-def get_stereo_info(path):
-    """Get stereo width/correlation info."""
-    cmd = [
-        "ffmpeg", "-i", path, "-af",
-        "astats=metadata=1:reset=0",
+def _spectral_balance_ffmpeg(path):
+    """Fallback without NumPy: one ffmpeg pass with parallel bandpass branches."""
+    bands = _SPECTRAL_BANDS
+
+    # One decode, split into nine bandpass+astats branches — instead of nine
+    # full decodes of the same file.
+    n = len(bands)
+    split = f"[0:a]asplit={n}" + "".join(f"[a{i}]" for i in range(n))
+    branches = [
+        f"[a{i}]highpass=f={low},lowpass=f={high},astats=metadata=1:reset=0[o{i}]"
+        for i, (_, low, high) in enumerate(bands)
+    ]
+    filter_complex = ";".join([split] + branches)
+
+    cmd = _FFMPEG + ["-i", path, "-filter_complex", filter_complex]
+    for i in range(n):
+        cmd += ["-map", f"[o{i}]"]
+    cmd += ["-f", "null", "-"]
+    output = _run(cmd)
+
+    # Each astats instance prints its summary prefixed with its parsed-filter
+    # index. The graph is built above, so those indices are known: asplit is
+    # filter 0 and each branch adds highpass, lowpass, astats in order,
+    # putting branch i's astats at 3*i + 3.
+    rms_by_idx = {}
+    current_idx = None
+    in_overall = False
+    for line in output.split("\n"):
+        m = _ASTATS_BLOCK_RE.search(line)
+        if m:
+            idx = int(m.group(1))
+            if idx != current_idx:
+                current_idx = idx
+                in_overall = False
+        if "Overall" in line:
+            in_overall = True
+        if "RMS level dB:" in line and current_idx is not None:
+            try:
+                val = float(line.split("RMS level dB:")[1].strip())
+            except (IndexError, ValueError):
+                continue
+            # Prefer the Overall row; fall back to the last per-channel value
+            if in_overall or current_idx not in rms_by_idx:
+                rms_by_idx[current_idx] = val
+
+    # Map each collected index to its band through the expected positions,
+    # so one missing or unparseable branch can't shift every later band
+    # onto the next branch's value.
+    idx_to_name = {3 * i + 3: band[0] for i, band in enumerate(bands)}
+    results = {}
+    for idx, val in rms_by_idx.items():
+        name = idx_to_name.get(idx)
+        if name is not None:
+            results[name] = val
+
+    if not results and len(rms_by_idx) == n:
+        # The ffmpeg build numbered the filters differently; a positional
+        # mapping is only safe when every branch reported.
+        for (name, _, _), idx in zip(bands, sorted(rms_by_idx)):
+            results[name] = rms_by_idx[idx]
+
+    return results
+
+
+@functools.lru_cache(maxsize=None)
+def _astats_pass(path):
+    """Run the full-file astats pass once; cache (metadata dict, input header).
+
+    The metadata dict carries astats' lavfi.astats.* values printed by
+    ametadata on stdout — stable across ffmpeg versions and trivially
+    parseable, unlike the English summary on stderr. The header is the start
+    of stderr, where ffmpeg prints the Duration/Stream lines that
+    get_audio_info mines, saving a dedicated ffprobe spawn.
+    """
+    cmd = _FFMPEG + [
+        "-i", path, "-af",
+        # Large frames so ametadata prints a handful of snapshots rather than
+        # one per 1024-sample frame; the last snapshot has the full-file stats.
+        "asetnsamples=n=16777216:p=0,astats=metadata=1:reset=0,"
+        "ametadata=mode=print:file=-",
         "-f", "null", "-"
     ]
-    result = subprocess.run(cmd, capture_output=True, text=True)
-    output = result.stderr
+    proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    out, err = proc.communicate()
+    meta = {}
+    for line in out[-_OUTPUT_TAIL:].decode("utf-8", "replace").splitlines():
+        if "=" in line:
+            key, _, val = line.partition("=")
+            meta[key] = val  # later snapshots overwrite earlier ones
+    header = err[:8192].decode("utf-8", "replace")
+    return meta, header
+
+
+def _astats_metadata(path):
+    return _astats_pass(path)[0]
+
+
+def _meta_series(meta, field):
+    """Per-channel values followed by the Overall value for one astats field."""
+    values = []
+    ch = 1
+    while True:
+        raw = meta.get(f"lavfi.astats.{ch}.{field}")
+        if raw is None:
+            break
+        try:
+            values.append(float(raw))
+        except ValueError:
+            pass
+        ch += 1
+    raw = meta.get(f"lavfi.astats.Overall.{field}")
+    if raw is not None:
+        try:
+            values.append(float(raw))
+        except ValueError:
+            pass
+    return values
+
+
+def get_overall_rms(path):
+    """Get the overall RMS level in dB from the cached astats pass."""
+    try:
+        return float(_astats_metadata(path)["lavfi.astats.Overall.RMS_level"])
+    except (KeyError, ValueError):
+        return None
+
+
+def get_stereo_info(path):
+    """Get stereo width/correlation info."""
+    meta = _astats_metadata(path)
 
     info = {}
-    lines = output.split("\n")
-    for i, line in enumerate(lines):
-        if "Peak level dB:" in line:
-            try:
-                val = line.split("Peak level dB:")[1].strip()
-                if "Overall" in lines[max(0, i-3):i+1][-1] if lines[max(0, i-3):i+1] else "":
-                    info["peak_db"] = float(val)
-                elif "peak_db" not in info:
-                    info.setdefault("channel_peaks", []).append(float(val))
-            except (IndexError, ValueError):
-                pass
-        elif "RMS level dB:" in line:
-            try:
-                val = line.split("RMS level dB:")[1].strip()
-                info.setdefault("rms_values", []).append(float(val))
-            except (IndexError, ValueError):
-                pass
-        elif "Crest factor:" in line:
-            try:
-                val = line.split("Crest factor:")[1].strip()
-                info.setdefault("crest_factors", []).append(float(val))
-            except (IndexError, ValueError):
-                pass
-        elif "Flat factor:" in line:
-            try:
-                val = line.split("Flat factor:")[1].strip()
-                info.setdefault("flat_factors", []).append(float(val))
-            except (IndexError, ValueError):
-                pass
-        elif "Dynamic range:" in line:
-            try:
-                val = line.split("Dynamic range:")[1].strip()
-                info.setdefault("dynamic_range", []).append(float(val))
-            except (IndexError, ValueError):
-                pass
+    for field, dest in [
+        ("Peak_level", "channel_peaks"),
+        ("RMS_level", "rms_values"),
+        ("Crest_factor", "crest_factors"),
+        ("Flat_factor", "flat_factors"),
+        ("Dynamic_range", "dynamic_range"),
+    ]:
+        values = _meta_series(meta, field)
+        if values:
+            info[dest] = values
 
     return info
 
 
-def get_dynamic_profile(path):
+def parse_astats(text):
+    """Parse an astats stderr summary into lists of values per field.
+
+    astats prints per-channel rows first and the Overall row last, so callers
+    take [-1] for the overall value and [:-1] for the channels.
+    """
+    fields = {
+        "RMS level dB": "rms",
+        "Peak level dB": "peak",
+        "Crest factor": "crest",
+        "Flat factor": "flat",
+        "Dynamic range": "dynamic_range",
+    }
+    out = {}
+    for key, val in _ASTATS_FIELD_RE.findall(text):
+        out.setdefault(fields[key], []).append(float(val))
+    return out
+
+
+def _segment_label(i, segment_count):
+    """Label a segment as a percentage range of the track, e.g. '25-37%'."""
+    pct_start = int((i / segment_count) * 100)
+    pct_end = int(((i + 1) / segment_count) * 100)
+    return f"{pct_start}-{pct_end}%"
+
+
+def _dynamic_profile_segments(path, segment_count, segment_duration, executor=None):
+    """Fallback: measure each segment with its own seeking ffmpeg pass."""
+    # -ss before -i uses the demuxer's fast input-side seek, and -to bounds the
+    # read without decode-and-discard slack.
+    cmds = [
+        _FFMPEG + [
+            "-ss", str(i * segment_duration),
+            "-to", str((i + 1) * segment_duration),
+            "-i", path, "-af",
+            "astats=metadata=1:reset=0",
+            "-f", "null", "-"
+        ]
+        for i in range(segment_count)
+    ]
+    run = executor.map if executor is not None else map
+    outputs = list(run(_run, cmds))
+
+    segments = []
+    for i, output in enumerate(outputs):
+        rms_rows = parse_astats(output).get("rms")
+        if rms_rows:
+            segments.append((_segment_label(i, segment_count), rms_rows[-1]))
+
+    return segments
+
+
+def get_dynamic_profile(path, executor=None, info=None):
     """Get loudness over time to understand dynamic arc."""
     # Get duration first
-    info = get_audio_info(path)
+    if info is None:
+        info = get_audio_info(path)
     if not info:
         return None
     duration = float(info.get("format", {}).get("duration", 0))
@@ -149,30 +402,43 @@ def get_dynamic_profile(path):
     # Measure loudness in 8 equal segments
     segment_count = 8
     segment_duration = duration / segment_count
-    segments = []
 
-    for i in range(segment_count):
-        start = i * segment_duration
-        cmd = [
-            "ffmpeg", "-ss", str(start), "-t", str(segment_duration),
-            "-i", path, "-af",
-            "astats=metadata=1:reset=0",
-            "-f", "null", "-"
-        ]
-        result = subprocess.run(cmd, capture_output=True, text=True)
-        output = result.stderr
-        rms = None
-        for line in output.split("\n"):
-            if "RMS level dB:" in line:
-                try:
-                    val = line.split("RMS level dB:")[1].strip()
-                    rms = float(val)
-                except (IndexError, ValueError):
-                    pass
-        if rms is not None:
-            pct_start = int((i / segment_count) * 100)
-            pct_end = int(((i + 1) / segment_count) * 100)
-            segments.append((f"{pct_start}-{pct_end}%", rms))
+    # Single pass: chunk the stream into segment-sized frames, have astats
+    # reset per frame, and print each frame's RMS as machine-readable metadata.
+    # This decodes the file once instead of once per segment.
+    sample_rate = 44100
+    for stream in info.get("streams", []):
+        if stream.get("codec_type") == "audio":
+            try:
+                sample_rate = int(stream.get("sample_rate", sample_rate))
+            except (TypeError, ValueError):
+                pass
+            break
+    seg_samples = max(1, int(segment_duration * sample_rate))
+
+    cmd = _FFMPEG + [
+        "-i", path, "-af",
+        f"asetnsamples=n={seg_samples}:p=0,astats=metadata=1:reset=1,"
+        "ametadata=mode=print:key=lavfi.astats.Overall.RMS_level:file=-",
+        "-f", "null", "-"
+    ]
+    result = subprocess.run(cmd, capture_output=True, text=True)
+
+    values = []
+    for line in result.stdout.split("\n"):
+        if line.startswith("lavfi.astats.Overall.RMS_level="):
+            try:
+                values.append(float(line.split("=", 1)[1]))
+            except ValueError:
+                pass
+
+    segments = [
+        (_segment_label(i, segment_count), rms)
+        for i, rms in enumerate(values[:segment_count])
+    ]
+    if not segments:
+        # Older ffmpeg builds without ametadata support
+        segments = _dynamic_profile_segments(path, segment_count, segment_duration, executor)
 
     return segments, duration
 
@@ -270,20 +536,26 @@ def main():
         print(f"Error: File not found: {path}", file=sys.stderr)
         sys.exit(1)
 
-    # Check ffmpeg is available
-    try:
-        subprocess.run(["ffmpeg", "-version"], capture_output=True, check=True)
-    except FileNotFoundError:
+    # Check ffmpeg is available — a which() lookup, not a process spawn
+    if shutil.which("ffmpeg") is None:
         print("Error: ffmpeg is required but not installed. Run: brew install ffmpeg", file=sys.stderr)
         sys.exit(1)
 
     print(f"Analyzing reference track... (this takes a moment)", file=sys.stderr)
 
-    audio_info = get_audio_info(path)
-    loudness = get_loudness(path)
-    spectral = get_spectral_balance(path)
-    stereo = get_stereo_info(path)
-    dynamics = get_dynamic_profile(path)
+    # All passes are independent read-only decodes of the same file, so fan
+    # them out over a thread pool — the work is subprocess-bound, not GIL-bound.
+    with ThreadPoolExecutor(max_workers=_max_workers()) as executor:
+        loudness_future = executor.submit(get_loudness, path)
+        spectral_future = executor.submit(get_spectral_balance, path)
+        # get_audio_info and get_stereo_info share the cached astats pass, so
+        # run them on this thread in sequence (the second is a cache hit), and
+        # get_dynamic_profile fans its fallback out through the pool.
+        audio_info = get_audio_info(path)
+        stereo = get_stereo_info(path)
+        dynamics = get_dynamic_profile(path, executor, info=audio_info)
+        loudness = loudness_future.result()
+        spectral = spectral_future.result()
 
     output = format_output(path, audio_info, loudness, spectral, stereo, dynamics)
     print(output)
@@ -5,10 +5,22 @@ Scores a mix on gain staging, stereo image, dynamics, frequency balance,
 effects usage, and master chain — all from the .als XML data alone.
 """
 
+import io
 import sys
 import gzip
 import math
-import xml.etree.ElementTree as ET
+
+try:
+    # lxml's C parser is several times faster on big sets; same find() API
+    from lxml import etree as ET
+except ImportError:
+    import xml.etree.ElementTree as ET
+
+try:
+    # Optional: vectorizes the numeric scorer counts on big sessions
+    import numpy as np
+except ImportError:
+    np = None
 
 
 def vol_to_db(value):
@@ -51,15 +63,20 @@ DEVICE_NAMES = {
     "Vst3PluginDevice": "VST3",
 }
 
-EQ_TAGS = {"Eq8", "ChannelEq"}
-COMP_TAGS = {"Compressor2", "GlueCompressor"}
-LIMITER_TAGS = {"Limiter"}
-PLUGIN_TAGS = {"PluginDevice", "AuPluginDevice", "Vst3PluginDevice"}
+EQ_TAGS = frozenset({"Eq8", "ChannelEq"})
+COMP_TAGS = frozenset({"Compressor2", "GlueCompressor"})
+LIMITER_TAGS = frozenset({"Limiter"})
+PLUGIN_TAGS = frozenset({"PluginDevice", "AuPluginDevice", "Vst3PluginDevice"})
+
+# Name heuristics used by the scorers, matched against pre-lowercased names
+BASS_NAMES = frozenset({"sub", "kick", "low bass"})
+HIGH_PREFIXES = ("high", "hi")
+KEY_ELEMENTS = (("snare", "Snare"), ("vox", "Vocal"), ("vocal", "Vocal"))
 
 
 def extract_tracks(root):
     """Extract track info for scoring."""
-    tracks_el = root.find(".//LiveSet/Tracks")
+    tracks_el = root.find("LiveSet/Tracks")
     if tracks_el is None:
         return [], [], []
 
@@ -71,14 +88,14 @@ def extract_tracks(root):
     return_names = []
     for t in tracks_el:
         if t.tag == "ReturnTrack":
-            name_el = t.find(".//Name/EffectiveName")
+            name_el = t.find("Name/EffectiveName")
             return_names.append(name_el.get("Value") if name_el is not None else "?")
 
     for t in tracks_el:
-        name_el = t.find(".//Name/EffectiveName")
+        name_el = t.find("Name/EffectiveName")
         name = name_el.get("Value") if name_el is not None else "?"
 
-        mixer = t.find(".//DeviceChain/Mixer")
+        mixer = t.find("DeviceChain/Mixer")
         vol_db = None
         pan_val = 0
         is_muted = False
@@ -138,6 +155,7 @@ def extract_tracks(root):
 
         track_data = {
             "name": name,
+            "name_lower": name.lower(),
             "type": t.tag,
             "id": t.get("Id"),
             "vol_db": vol_db,
@@ -146,6 +164,7 @@ def extract_tracks(root):
             "sends_active": sends_active,
             "sends_total": sends_total,
             "device_tags": device_tags,
+            "device_tags_set": frozenset(device_tags),
             "device_info": device_info,
         }
 
@@ -160,13 +179,13 @@ def extract_tracks(root):
 
 
 def extract_master(root):
-    master = root.find(".//LiveSet/MainTrack")
+    master = root.find("LiveSet/MainTrack")
     if master is None:
-        master = root.find(".//LiveSet/MasterTrack")
+        master = root.find("LiveSet/MasterTrack")
     if master is None:
         return None
 
-    vol_el = master.find(".//Mixer/Volume/Manual")
+    vol_el = master.find("DeviceChain/Mixer/Volume/Manual")
     devices_el = master.find("DeviceChain/DeviceChain/Devices")
     device_tags = []
     if devices_el is not None:
@@ -187,6 +206,7 @@ def extract_master(root):
     return {
         "vol_db": vol_to_db(vol_el.get("Value")) if vol_el is not None else None,
         "device_tags": device_tags,
+        "device_tags_set": frozenset(device_tags),
         "limiter": limiter_info,
     }
 
@@ -200,8 +220,32 @@ def score_gain_staging(tracks, groups):
     if not non_muted:
         return 0, ["No active tracks"]
 
-    # Check how many tracks are at default 0.0 dB
-    default_count = sum(1 for t in non_muted if t["vol_db"] is not None and abs(t["vol_db"]) < 0.05)
+    # Count defaults, hot tracks, and the ideal range together — vectorized
+    # over a volume array when NumPy is around, one Python pass otherwise
+    if np is not None:
+        vols = np.array(
+            [t["vol_db"] if t["vol_db"] is not None else np.nan for t in non_muted],
+            dtype=np.float64,
+        )
+        valid = ~np.isnan(vols)
+        default_count = int(np.count_nonzero(valid & (np.abs(vols) < 0.05)))
+        in_range = int(np.count_nonzero(valid & (vols >= -18) & (vols <= -6)))
+        hot_mask = valid & (vols > 3.0)
+        hot = [t["name"] for t, h in zip(non_muted, hot_mask) if h]
+    else:
+        default_count = in_range = 0
+        hot = []
+        for t in non_muted:
+            v = t["vol_db"]
+            if v is None:
+                continue
+            if abs(v) < 0.05:
+                default_count += 1
+            if v > 3.0:
+                hot.append(t["name"])
+            if -18 <= v <= -6:
+                in_range += 1
+
     default_pct = default_count / len(non_muted)
     if default_pct > 0.5:
         penalty = int(default_pct * 40)
@@ -213,17 +257,17 @@ def score_gain_staging(tracks, groups):
         issues.append(f"{default_count}/{len(non_muted)} tracks at default 0.0 dB (-{penalty}pts)")
 
     # Check for tracks too hot (above +3 dB)
-    hot = [t["name"] for t in non_muted if t["vol_db"] is not None and t["vol_db"] > 3.0]
     if hot:
         score -= 10 * len(hot)
         issues.append(f"Tracks above +3 dB: {', '.join(hot)} (-{10*len(hot)}pts)")
 
     # Check for good range (-18 to -6)
-    in_range = sum(1 for t in non_muted if t["vol_db"] is not None and -18 <= t["vol_db"] <= -6)
     range_pct = in_range / len(non_muted) if non_muted else 0
     if range_pct > 0.5:
         bonus = int(range_pct * 15)
-        score = min(100, score + bonus)
+        # No mid-stream clamp: clamping here would silently absorb later
+        # penalties. Accumulate freely and clamp once at the return.
+        score += bonus
         issues.append(f"{in_range}/{len(non_muted)} tracks in ideal -18 to -6 dB range (+{bonus}pts)")
 
     # Check group faders
@@ -249,7 +293,38 @@ def score_stereo_image(tracks):
     if not non_muted:
         return 0, ["No active tracks"]
 
-    center_count = sum(1 for t in non_muted if abs(t["pan"]) < 0.02)
+    # Center/extreme counts plus the bass-placement heuristic. The numeric
+    # counts vectorize over a pan array; the name matching stays on the
+    # Python side either way.
+    if np is not None:
+        pans = np.abs(np.array([t["pan"] for t in non_muted], dtype=np.float64))
+        center_count = int(np.count_nonzero(pans < 0.02))
+        extreme_mask = pans > 0.8
+        extreme = [t["name"] for t, e in zip(non_muted, extreme_mask) if e]
+        off_center = zip(non_muted, pans > 0.1)
+    else:
+        center_count = 0
+        extreme = []
+        off_center = ((t, abs(t["pan"]) > 0.1) for t in non_muted)
+        for t in non_muted:
+            pan = abs(t["pan"])
+            if pan < 0.02:
+                center_count += 1
+            if pan > 0.8:
+                extreme.append(t["name"])
+
+    # Only flag bass tracks that are clearly low-frequency fundamentals;
+    # names starting with "high"/"hi" are upper harmonics and get skipped.
+    bass_off_center = []
+    for t, is_off in off_center:
+        if not is_off:
+            continue
+        name_lower = t["name_lower"]
+        if name_lower.startswith(HIGH_PREFIXES):
+            continue
+        if any(b == name_lower or (b in name_lower and "high" not in name_lower) for b in BASS_NAMES):
+            bass_off_center.append(t["name"])
+
     center_pct = center_count / len(non_muted)
 
     if center_pct > 0.85:
@@ -265,23 +340,13 @@ def score_stereo_image(tracks):
         issues.append(f"Good stereo spread: {len(non_muted) - center_count}/{len(non_muted)} tracks panned off-center")
 
     # Check for extreme panning (>40)
-    extreme = [t["name"] for t in non_muted if abs(t["pan"]) > 0.8]
     if extreme:
         score -= 5 * len(extreme)
         issues.append(f"Extreme panning (>40): {', '.join(extreme)} (-{5*len(extreme)}pts)")
 
-    # Check bass elements are centered (by name heuristic)
-    # Only flag tracks that are clearly low-frequency fundamentals
-    bass_names = {"sub", "kick", "low bass"}
-    high_prefixes = {"high", "hi"}
-    for t in non_muted:
-        name_lower = t["name"].lower()
-        # Skip names that start with "high" — those are upper harmonics
-        if any(name_lower.startswith(p) for p in high_prefixes):
-            continue
-        if any(b == name_lower or (b in name_lower and "high" not in name_lower) for b in bass_names) and abs(t["pan"]) > 0.1:
-            score -= 10
-            issues.append(f"Bass element '{t['name']}' panned off-center (-10pts)")
+    for name in bass_off_center:
+        score -= 10
+        issues.append(f"Bass element '{name}' panned off-center (-10pts)")
 
     return max(0, min(100, score)), issues
 
@@ -295,7 +360,7 @@ def score_dynamics(tracks):
     if not non_muted:
         return 0, ["No active tracks"]
 
-    # Check for compression on key elements
+    # One pass: compressor settings plus the key-element name checks
     has_any_comp = False
     for t in non_muted:
         has_comp = any(d["tag"] in COMP_TAGS and d["on"] for d in t["device_info"])
@@ -323,22 +388,21 @@ def score_dynamics(tracks):
                     score += 5
                     issues.append(f"'{t['name']}' compressor ratio {ratio:.1f}, threshold {threshold:.1f} dB — good (+5pts)")
 
+        # Key elements by name usually need compression
+        name_lower = t["name_lower"]
+        for keyword, label in KEY_ELEMENTS:
+            if keyword in name_lower:
+                if has_comp:
+                    score += 5
+                    issues.append(f"'{t['name']}' has compression — good for {label} (+5pts)")
+                else:
+                    score -= 5
+                    issues.append(f"'{t['name']}' has no compression — {label} usually needs it (-5pts)")
+
     if not has_any_comp:
         score -= 20
         issues.append(f"No compression on any track (-20pts)")
 
-    # Check for key elements by name
-    for keyword, label in [("snare", "Snare"), ("vox", "Vocal"), ("vocal", "Vocal")]:
-        matches = [t for t in non_muted if keyword in t["name"].lower()]
-        for t in matches:
-            has_comp = any(d["tag"] in COMP_TAGS and d["on"] for d in t["device_info"])
-            if has_comp:
-                score += 5
-                issues.append(f"'{t['name']}' has compression — good for {label} (+5pts)")
-            else:
-                score -= 5
-                issues.append(f"'{t['name']}' has no compression — {label} usually needs it (-5pts)")
-
     return max(0, min(100, score)), issues
 
 
@@ -351,7 +415,15 @@ def score_frequency_balance(tracks):
     if not non_muted:
         return 0, ["No active tracks"]
 
-    has_eq_count = sum(1 for t in non_muted if any(d in EQ_TAGS for d in t["device_tags"]))
+    # One pass: EQ coverage and device-less tracks together
+    has_eq_count = 0
+    empty = []
+    for t in non_muted:
+        if t["device_tags_set"] & EQ_TAGS:
+            has_eq_count += 1
+        if not t["device_tags"]:
+            empty.append(t["name"])
+
     eq_pct = has_eq_count / len(non_muted)
 
     if eq_pct == 0:
@@ -368,7 +440,6 @@ def score_frequency_balance(tracks):
         issues.append(f"{has_eq_count}/{len(non_muted)} tracks have EQ (+5pts)")
 
     # Check for tracks with no processing at all
-    empty = [t["name"] for t in non_muted if len(t["device_tags"]) == 0]
     if empty:
         score -= 3 * len(empty)
         issues.append(f"Tracks with no devices: {', '.join(empty[:5])} (-{3*len(empty)}pts)")
@@ -404,9 +475,9 @@ def score_effects_sends(tracks, returns):
 
     # Check return tracks have appropriate devices
     for r in returns:
-        has_reverb = "Reverb" in r["device_tags"]
-        has_delay = "Delay" in r["device_tags"]
-        has_comp = any(t in COMP_TAGS for t in r["device_tags"])
+        has_reverb = "Reverb" in r["device_tags_set"]
+        has_delay = "Delay" in r["device_tags_set"]
+        has_comp = bool(r["device_tags_set"] & COMP_TAGS)
         if has_reverb or has_delay or has_comp:
             score += 5
             issues.append(f"Return '{r['name']}' has processing — good (+5pts)")
@@ -422,9 +493,9 @@ def score_master(master):
     if master is None:
         return 0, ["No master track found"]
 
-    has_limiter = any(t in LIMITER_TAGS for t in master["device_tags"])
-    has_eq = any(t in EQ_TAGS for t in master["device_tags"])
-    has_comp = any(t in COMP_TAGS for t in master["device_tags"])
+    has_limiter = bool(master["device_tags_set"] & LIMITER_TAGS)
+    has_eq = bool(master["device_tags_set"] & EQ_TAGS)
+    has_comp = bool(master["device_tags_set"] & COMP_TAGS)
 
     if has_limiter:
         score += 25
@@ -448,9 +519,9 @@ def score_master(master):
         issues.append(f"EQ on master (+5pts)")
 
     # Check for metering (Spectrum, etc.)
-    has_meter = "SpectrumAnalyzer" in master["device_tags"] or "Spectrum" in master.get("device_tags", [])
+    has_meter = "SpectrumAnalyzer" in master["device_tags_set"] or "Spectrum" in master["device_tags_set"]
     # Check for plugin metering
-    has_plugin = any(t in PLUGIN_TAGS for t in master["device_tags"])
+    has_plugin = bool(master["device_tags_set"] & PLUGIN_TAGS)
     if has_meter or has_plugin:
         score += 5
         issues.append(f"Metering/analysis on master (+5pts)")
@@ -462,6 +533,27 @@ def score_master(master):
     return max(0, min(100, score)), issues
 
 
+# Subtrees the scorers never read — cleared as soon as they finish parsing so
+# peak memory tracks the mixer metadata, not the clip/automation payload.
+_PRUNE_TAGS = frozenset({
+    "AudioClip", "MidiClip", "AutomationEnvelope", "KeyTracks", "WarpMarkers",
+})
+
+
+def load_liveset(path):
+    """Parse the .als, dropping clip/automation subtrees as they stream by."""
+    with open(path, "rb") as f:
+        data = gzip.decompress(f.read())
+    root = None
+    for event, elem in ET.iterparse(io.BytesIO(data), events=("start", "end")):
+        if event == "start":
+            if root is None:
+                root = elem
+        elif elem.tag in _PRUNE_TAGS:
+            elem.clear()
+    return root
+
+
 def overall_grade(total_score):
     if total_score >= 85:
         return "A", "Mix Ready — professional-level mixing decisions"
@@ -482,17 +574,17 @@ def main():
 
     path = sys.argv[1]
     try:
-        with gzip.open(path, "rt", encoding="utf-8") as f:
-            tree = ET.parse(f)
+        root = load_liveset(path)
     except Exception as e:
         print(f"Error: {e}", file=sys.stderr)
         sys.exit(1)
-
-    root = tree.getroot()
+    if root is None:
+        print("Error: empty .als file", file=sys.stderr)
+        sys.exit(1)
     creator = root.get("Creator", "Unknown")
-    tempo_el = root.find(".//MainTrack/.//Mixer/Tempo/Manual")
+    tempo_el = root.find("LiveSet/MainTrack/DeviceChain/Mixer/Tempo/Manual")
     if tempo_el is None:
-        tempo_el = root.find(".//MasterTrack/.//Mixer/Tempo/Manual")
+        tempo_el = root.find("LiveSet/MasterTrack/DeviceChain/Mixer/Tempo/Manual")
     tempo = tempo_el.get("Value") if tempo_el is not None else "?"
 
     tracks, returns, groups = extract_tracks(root)
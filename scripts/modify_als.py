@@ -27,48 +27,192 @@ Special track names:
 """
 
 import sys
+import functools
 import gzip
+import io
 import json
 import math
 import os
-import copy
-import xml.etree.ElementTree as ET
+import re
+import shutil
+import subprocess
 
+try:
+    from lxml import etree as ET
+except ImportError:
+    import xml.etree.ElementTree as ET
 
+
+def _make_parser():
+    """An lxml parser tuned for .als payloads, or None for the stdlib engine.
+
+    collect_ids=False skips building the xml:id index — Live Sets carry an
+    Id attribute on nearly every element and the index is never queried.
+    huge_tree lifts libxml2's size guards for very large sets, and entity
+    resolution is off since .als files never use entities.
+    """
+    try:
+        return ET.XMLParser(collect_ids=False, huge_tree=True,
+                            remove_blank_text=False, resolve_entities=False)
+    except TypeError:
+        # stdlib ElementTree's parser takes none of these knobs
+        return None
+
+
+_PARSER = _make_parser()
+
+
+# Prefer pigz for (de)compression: it runs in a separate process (and in
+# parallel for compression), which beats Python's gzip module on big sets.
+_PIGZ = shutil.which("pigz")
+
+
+def open_als_read(path):
+    """Open a decompressed byte stream over an .als file.
+
+    Returns (stream, proc); proc is the pigz subprocess to wait on, or None
+    when falling back to the gzip module.
+    """
+    if _PIGZ:
+        proc = subprocess.Popen([_PIGZ, "-dc", path], stdout=subprocess.PIPE)
+        return proc.stdout, proc
+    return gzip.open(path, "rb"), None
+
+
+# ElementTree serializes in many small writes; batching them before they
+# reach the compressor keeps zlib working on big blocks.
+_WRITE_BUFFER = 128 * 1024
+
+
+def open_als_write(path):
+    """Open a compressing byte sink for an .als file. Same contract as open_als_read."""
+    if _PIGZ:
+        sink = open(path, "wb")
+        proc = subprocess.Popen([_PIGZ, "-c"], stdin=subprocess.PIPE, stdout=sink,
+                                bufsize=_WRITE_BUFFER)
+        sink.close()
+        return proc.stdin, proc
+    return io.BufferedWriter(gzip.open(path, "wb"), buffer_size=_WRITE_BUFFER), None
+
+
+@functools.lru_cache(maxsize=256)
 def db_to_linear(db):
-    """Convert dB to linear volume value."""
+    """Convert dB to linear volume value.
+
+    Cached: bulk change files repeat the same handful of dB values (-6, -3,
+    0 ...) across many tracks, so most conversions are dict hits.
+    """
     if db is None or db <= -70:
         return 0.0003162277571  # Ableton's -inf
     return 10 ** (db / 20.0)
 
 
+@functools.lru_cache(maxsize=256)
+def db_to_linear_str(db):
+    """db_to_linear with the result already formatted for .set("Value", ...).
+
+    float-to-str formatting is not free, and the same dB value repeats
+    across tracks; caching the string skips it on every repeat.
+    """
+    return str(db_to_linear(db))
+
+
+# Pan strings are a number plus optional L/R suffix; the suffix picks the
+# sign and the /50 scaling in one table lookup.
+_PAN_RE = re.compile(r"^\s*(-?\d+(?:\.\d+)?)\s*([LlRr]?)\s*$")
+_PAN_SCALE = {"L": -1 / 50.0, "l": -1 / 50.0, "R": 1 / 50.0, "r": 1 / 50.0, "": 1.0}
+
+
 def pan_str_to_value(pan_str):
     """Convert pan string like '18R', '22L', 'C' to internal -1 to 1 value."""
-    pan_str = str(pan_str).strip()
-    if pan_str.upper() == "C" or pan_str == "0":
+    pan_str = str(pan_str)
+    if pan_str.strip() in ("C", "c"):
         return 0.0
-    if pan_str.upper().endswith("L"):
-        pos = float(pan_str[:-1])
-        return -(pos / 50.0)
-    elif pan_str.upper().endswith("R"):
-        pos = float(pan_str[:-1])
-        return pos / 50.0
-    else:
-        # Try as raw float
-        return float(pan_str)
+    m = _PAN_RE.match(pan_str)
+    if m:
+        return float(m.group(1)) * _PAN_SCALE[m.group(2)]
+    # Fall back to a raw float (e.g. scientific notation)
+    return float(pan_str)
+
+
+def build_track_index(tracks_el):
+    """Index tracks by (name, tag) and (name, None), built once per run.
+
+    Turns the per-change linear scan over all tracks into a dict lookup.
+    Also returns the (name, element) list of return tracks, since RETURN:
+    changes match by substring rather than exact name.
+    """
+    index = {}
+    return_tracks = []
+    for track in tracks_el:
+        name_el = track.find(EFFECTIVE_NAME_PATH)
+        if name_el is None:
+            continue
+        name = name_el.get("Value")
+        index.setdefault((name, None), []).append(track)
+        index.setdefault((name, track.tag), []).append(track)
+        if track.tag == "ReturnTrack":
+            return_tracks.append((name or "", track))
+    return index, return_tracks
 
 
-def find_tracks_by_name(tracks_el, name, track_type=None):
+def find_tracks_by_name(name_index, name, track_type=None):
     """Find track elements matching a name and optional type."""
-    matches = []
-    for track in tracks_el:
-        name_el = track.find(".//Name/EffectiveName")
-        if name_el is None:
+    return name_index.get((name, track_type), [])
+
+
+# The .als schema is fixed, so every path the change loop evaluates is
+# hoisted here — one place to anchor them, and each string is built once.
+# All are anchored at the holding element: ".//" descendant scans walk the
+# entire subtree (every device, clip and automation node under a track)
+# just to reach a child at a known depth.
+EFFECTIVE_NAME_PATH = "Name/EffectiveName"
+MIXER_PATH = "DeviceChain/Mixer"
+MAIN_TRACK_PATH = "LiveSet/MainTrack"
+MASTER_TRACK_PATH = "LiveSet/MasterTrack"
+TRACKS_PATH = "LiveSet/Tracks"
+DEVICES_PATH = "DeviceChain/DeviceChain/Devices"
+VOLUME_PATH = "Volume/Manual"
+PAN_PATH = "Pan/Manual"
+SEND_MANUAL_PATH = "Send/Manual"
+ON_PATH = "On/Manual"
+
+VALID_TARGETS = frozenset({"volume", "pan", "send", "device_param", "add_device",
+                           "group_volume"})
+
+# Fields each target needs beyond track_name, checked before any mutation
+REQUIRED_FIELDS = {
+    "volume": ("value",),
+    "group_volume": ("value",),
+    "pan": ("value",),
+    "send": ("value",),
+    "device_param": ("device_tag", "param_name", "param_value"),
+    "add_device": ("device_tag",),
+}
+
+
+def validate_changes(changes):
+    """Validate the whole change list before anything is applied.
+
+    Returns a list of ERROR strings; empty means every change is
+    well-formed. Failing up front means a malformed entry can never leave
+    the set half-modified.
+    """
+    errors = []
+    for i, change in enumerate(changes):
+        if not isinstance(change, dict):
+            errors.append(f"ERROR: Change {i} is not an object")
             continue
-        if name_el.get("Value") == name:
-            if track_type is None or track.tag == track_type:
-                matches.append(track)
-    return matches
+        if not change.get("track_name"):
+            errors.append(f"ERROR: Change {i} is missing 'track_name'")
+        target = change.get("target")
+        if target not in VALID_TARGETS:
+            errors.append(f"ERROR: Change {i} has unknown target '{target}'")
+            continue
+        for field in REQUIRED_FIELDS[target]:
+            if field not in change:
+                errors.append(f"ERROR: Change {i} ({target}) is missing '{field}'")
+    return errors
 
 
 # Device parameters that are stored as linear amplitude values in XML
@@ -84,33 +228,66 @@ DB_LINEAR_PARAMS = {
 
 def find_max_id(root):
     """Find the highest Id attribute value in the entire XML tree."""
+    if hasattr(root, "xpath"):
+        # lxml: pull just the Id attribute values out in C, skipping the
+        # Python-level .get() on every element of the tree.
+        ids = root.xpath("//*/@Id")
+        return max((int(v) for v in ids if v.isdigit()), default=0)
     max_id = 0
     for el in root.iter():
         id_val = el.get("Id")
-        if id_val is not None:
-            try:
-                max_id = max(max_id, int(id_val))
-            except ValueError:
-                pass
+        # isdigit is far cheaper than raising/catching ValueError on the
+        # odd non-numeric Id (e.g. hashes on some pointee attributes)
+        if id_val and id_val.isdigit():
+            val = int(id_val)
+            if val > max_id:
+                max_id = val
     return max_id
 
 
-def find_donor_device(root, device_tag):
-    """Find an existing device of the given type anywhere in the project to use as a template."""
-    for el in root.iter():
-        if el.tag == device_tag:
-            return el
-    return None
+def find_donor_device(root, device_tag, donor_cache):
+    """Find an existing device of the given type anywhere in the project to use as a template.
+
+    The first lookup walks the tree once and records the first element seen
+    per tag; later lookups are dict hits. The cache holds live element
+    references, so in-place parameter edits made between adds show through;
+    add_device drops a tag's entry when it inserts a clone, since the clone
+    may displace the cached element as first in document order.
+    """
+    donor = donor_cache.get(device_tag)
+    if donor is not None:
+        return donor
+    if not donor_cache:
+        for el in root.iter():
+            if el.tag not in donor_cache:
+                donor_cache[el.tag] = el
+        return donor_cache.get(device_tag)
+    # Entry was invalidated by an earlier add; re-resolve just this tag.
+    donor = next(iter(root.iter(device_tag)), None)
+    if donor is not None:
+        donor_cache[device_tag] = donor
+    return donor
+
+
+def clone_device(donor, device_tag):
+    """Clone a donor subtree by round-tripping it through the XML serializer.
+
+    tostring/fromstring runs in the parser's C code and beats copy.deepcopy,
+    which re-enters Python for every element and attribute. The donor is
+    serialized fresh on every clone: earlier changes in the same run may
+    have mutated it, and the copy has to reflect its current state.
+    """
+    return ET.fromstring(ET.tostring(donor), _PARSER)
 
 
 def remap_ids(element, start_id):
     """Remap all Id attributes in an element tree to new unique values starting from start_id."""
-    next_id = start_id
-    for el in element.iter():
-        if "Id" in el.attrib:
-            el.set("Id", str(next_id))
-            next_id += 1
-    return next_id
+    targets = [el for el in element.iter() if "Id" in el.attrib]
+    # str(range(...)) via map runs the int formatting in one C loop rather
+    # than one Python-level str() call per element.
+    for el, id_str in zip(targets, map(str, range(start_id, start_id + len(targets)))):
+        el.set("Id", id_str)
+    return start_id + len(targets)
 
 
 def reset_eq8_defaults(device):
@@ -154,47 +331,94 @@ DEVICE_RESETTERS = {
 }
 
 
-def find_device(track_el, device_tag, device_index=0):
-    """Find a device in a track's device chain by tag and index."""
-    devices_el = track_el.find("DeviceChain/DeviceChain/Devices")
-    if devices_el is None:
-        return None
-    matches = [d for d in devices_el if d.tag == device_tag]
+def find_device(track_el, device_tag, device_index=0, device_cache=None):
+    """Find a device in a track's device chain by tag and index.
+
+    device_cache maps id(track_el) -> {tag: [devices]}, so a change file
+    that tweaks several devices on one track scans its chain only once.
+    add_device invalidates the entry when it mutates the chain.
+    """
+    key = id(track_el)
+    by_tag = device_cache.get(key) if device_cache is not None else None
+    if by_tag is None:
+        devices_el = track_el.find(DEVICES_PATH)
+        if devices_el is None:
+            return None
+        by_tag = {}
+        for d in devices_el:
+            by_tag.setdefault(d.tag, []).append(d)
+        if device_cache is not None:
+            device_cache[key] = by_tag
+    matches = by_tag.get(device_tag, ())
     if device_index < len(matches):
         return matches[device_index]
     return None
 
 
-def set_param_value(element, param_path, value):
-    """Set a parameter value, handling both Manual sub-element and direct Value attribute."""
+def get_and_set_param(element, param_path, value):
+    """Resolve a parameter path once: read the old value, write the new one.
+
+    Handles both Manual sub-elements and direct Value attributes. Returns
+    (True, old_value) on success, (False, None) if the path does not resolve
+    — one traversal instead of the read-then-write pair per change.
+    """
     parts = param_path.split("/")
     current = element
     for part in parts[:-1]:
         current = current.find(part)
         if current is None:
-            return False
+            return False, None
 
-    target_name = parts[-1]
-    target = current.find(target_name)
+    target = current.find(parts[-1])
     if target is None:
-        return False
+        return False, None
 
     # Check for Manual sub-element
     manual = target.find("Manual")
     if manual is not None:
+        old = manual.get("Value")
         manual.set("Value", str(value))
-        return True
+        return True, old
 
     # Direct Value attribute
     if "Value" in target.attrib:
+        old = target.get("Value")
         target.set("Value", str(value))
-        return True
+        return True, old
+
+    return False, None
+
+
+def build_context(root, tracks_el):
+    """Per-run lookup state shared by all apply_change calls.
+
+    Everything here is derived from the tree exactly once: the track name
+    index, the highest Id in use (advanced in place by add_device), and the
+    lazily filled donor and per-track device caches.
+    """
+    name_index, return_tracks = build_track_index(tracks_el)
+    # Document-scoped lookups resolve once here; per-change code never
+    # queries the root again.
+    main_track = root.find(MAIN_TRACK_PATH)
+    if main_track is None:
+        main_track = root.find(MASTER_TRACK_PATH)
+    return {
+        "name_index": name_index,
+        "return_tracks": return_tracks,
+        "main_track": main_track,
+        "id_counter": [find_max_id(root)],
+        "donor_cache": {},
+        "device_cache": {},
+    }
 
-    return False
 
+def apply_change(root, change, ctx, verbose=True):
+    """Apply a single change to the XML tree. Returns a description of what was done.
 
-def apply_change(root, tracks_el, change):
-    """Apply a single change to the XML tree. Returns a description of what was done."""
+    With verbose=False the change is still applied but the old-value reads,
+    dB math and f-string formatting for the log lines are skipped; only
+    ERROR entries come back.
+    """
     track_name = change.get("track_name", "")
     target = change.get("target", "")
     descriptions = []
@@ -203,24 +427,20 @@ def apply_change(root, tracks_el, change):
     track_el = None
 
     if track_name.upper() in ("MASTER", "MAIN"):
-        track_el = root.find(".//LiveSet/MainTrack")
-        if track_el is None:
-            track_el = root.find(".//LiveSet/MasterTrack")
+        track_el = ctx["main_track"]
         if track_el is None:
             return [f"ERROR: Could not find Main/Master track"]
     elif track_name.upper().startswith("RETURN:"):
         return_name = track_name[7:]
-        for t in tracks_el:
-            if t.tag == "ReturnTrack":
-                name_el = t.find(".//Name/EffectiveName")
-                if name_el is not None and return_name in name_el.get("Value", ""):
-                    track_el = t
-                    break
+        for name, t in ctx["return_tracks"]:
+            if return_name in name:
+                track_el = t
+                break
         if track_el is None:
             return [f"ERROR: Could not find return track '{return_name}'"]
     else:
         track_type = change.get("track_type")
-        matches = find_tracks_by_name(tracks_el, track_name, track_type)
+        matches = find_tracks_by_name(ctx["name_index"], track_name, track_type)
         track_index = change.get("track_index", 0)
         if not matches:
             return [f"ERROR: Could not find track '{track_name}'"]
@@ -228,42 +448,39 @@ def apply_change(root, tracks_el, change):
             return [f"ERROR: Track '{track_name}' index {track_index} out of range (found {len(matches)})"]
         track_el = matches[track_index]
 
-    mixer = track_el.find(".//DeviceChain/Mixer")
+    mixer = track_el.find(MIXER_PATH)
 
     if target == "volume":
         db_val = change.get("value")
-        linear = db_to_linear(db_val)
-        vol_el = mixer.find("Volume/Manual")
-        if vol_el is not None:
-            old_val = float(vol_el.get("Value", "1"))
+        linear = db_to_linear_str(db_val)
+        ok, old = get_and_set_param(mixer, VOLUME_PATH, linear)
+        if ok and verbose:
+            old_val = float(old if old is not None else "1")
             old_db = 20 * math.log10(old_val) if old_val > 0.0003163 else float("-inf")
-            vol_el.set("Value", str(linear))
             descriptions.append(f"  {track_name}: Volume {old_db:+.1f} → {db_val:+.1f} dB")
 
     elif target == "pan":
         pan_str = change.get("value")
         pan_val = pan_str_to_value(pan_str)
-        pan_el = mixer.find("Pan/Manual")
-        if pan_el is not None:
-            old_val = float(pan_el.get("Value", "0"))
+        ok, old = get_and_set_param(mixer, PAN_PATH, pan_val)
+        if ok and verbose:
+            old_val = float(old if old is not None else "0")
             old_str = "C" if abs(old_val) < 0.01 else f"{abs(old_val)*50:.0f}{'L' if old_val < 0 else 'R'}"
-            pan_el.set("Value", str(pan_val))
             descriptions.append(f"  {track_name}: Pan {old_str} → {pan_str}")
 
     elif target == "send":
         send_index = change.get("send_index", 0)
         db_val = change.get("value")
-        linear = db_to_linear(db_val)
+        linear = db_to_linear_str(db_val)
         sends_el = mixer.find("Sends")
         if sends_el is not None:
             holders = list(sends_el)
             if send_index < len(holders):
-                send_manual = holders[send_index].find("Send/Manual")
-                if send_manual is not None:
-                    old_val = float(send_manual.get("Value", "0.0003162277571"))
+                ok, old = get_and_set_param(holders[send_index], SEND_MANUAL_PATH, linear)
+                if ok and verbose:
+                    old_val = float(old if old is not None else "0.0003162277571")
                     old_db = 20 * math.log10(old_val) if old_val > 0.0003163 else float("-inf")
                     old_str = f"{old_db:+.1f}" if not math.isinf(old_db) else "-inf"
-                    send_manual.set("Value", str(linear))
                     send_label = chr(65 + send_index)
                     descriptions.append(f"  {track_name}: Send {send_label} {old_str} → {db_val:+.1f} dB")
 
@@ -273,44 +490,36 @@ def apply_change(root, tracks_el, change):
         param_name = change.get("param_name")
         param_value = change.get("param_value")
 
-        device = find_device(track_el, device_tag, device_index)
+        device = find_device(track_el, device_tag, device_index, ctx["device_cache"])
         if device is None:
             return [f"ERROR: Could not find device '{device_tag}' on track '{track_name}'"]
 
         # Convert dB→linear for params that use linear encoding
         display_value = param_value
-        if (device_tag, param_name) in DB_LINEAR_PARAMS:
-            param_value = db_to_linear(param_value)
+        is_db_linear = (device_tag, param_name) in DB_LINEAR_PARAMS
+        if is_db_linear:
+            param_value = db_to_linear_str(param_value)
             display_value = f"{change.get('param_value')} dB"
 
-        # Try to get old value for description
-        old_value = None
-        target_el = device.find(param_name)
-        if target_el is not None:
-            manual = target_el.find("Manual")
-            if manual is not None:
-                old_value = manual.get("Value")
-            elif "Value" in target_el.attrib:
-                old_value = target_el.get("Value")
-
-        # Format old value as dB for linear params
-        old_str = "?"
-        if old_value is not None:
-            if (device_tag, param_name) in DB_LINEAR_PARAMS:
-                old_float = float(old_value)
-                if old_float > 0.0003163:
-                    old_str = f"{20 * math.log10(old_float):.1f} dB"
+        success, old_value = get_and_set_param(device, param_name, param_value)
+        if not success:
+            return [f"ERROR: Could not set {param_name} on {device_tag} for track '{track_name}'"]
+
+        if verbose:
+            # Format old value as dB for linear params
+            old_str = "?"
+            if old_value is not None:
+                if is_db_linear:
+                    old_float = float(old_value)
+                    if old_float > 0.0003163:
+                        old_str = f"{20 * math.log10(old_float):.1f} dB"
+                    else:
+                        old_str = "-inf dB"
                 else:
-                    old_str = "-inf dB"
-            else:
-                old_str = str(old_value)
+                    old_str = str(old_value)
 
-        success = set_param_value(device, param_name, param_value)
-        if success:
             device_display = change.get("device_name", device_tag)
             descriptions.append(f"  {track_name}: {device_display} {param_name} {old_str} → {display_value}")
-        else:
-            return [f"ERROR: Could not set {param_name} on {device_tag} for track '{track_name}'"]
 
     elif target == "add_device":
         device_tag = change.get("device_tag")
@@ -319,16 +528,15 @@ def apply_change(root, tracks_el, change):
         device_display = change.get("device_name", device_tag)
 
         # Find a donor device to clone
-        donor = find_donor_device(root, device_tag)
+        donor = find_donor_device(root, device_tag, ctx["donor_cache"])
         if donor is None:
             return [f"ERROR: No existing '{device_tag}' found in project to use as template"]
 
-        # Deep copy the donor
-        new_device = copy.deepcopy(donor)
+        new_device = clone_device(donor, device_tag)
 
-        # Remap all IDs to unique values
-        max_id = find_max_id(root)
-        remap_ids(new_device, max_id + 1)
+        # Remap all IDs to fresh values from the running counter
+        id_counter = ctx["id_counter"]
+        id_counter[0] = remap_ids(new_device, id_counter[0] + 1) - 1
 
         # Reset to defaults if we have a resetter for this device type
         resetter = DEVICE_RESETTERS.get(device_tag)
@@ -336,7 +544,7 @@ def apply_change(root, tracks_el, change):
             resetter(new_device)
 
         # Ensure device is on
-        on_el = new_device.find("On/Manual")
+        on_el = new_device.find(ON_PATH)
         if on_el is not None:
             on_el.set("Value", "true")
 
@@ -345,13 +553,13 @@ def apply_change(root, tracks_el, change):
             # Handle dB→linear conversion for known params
             actual_val = param_val
             if (device_tag, param_path) in DB_LINEAR_PARAMS:
-                actual_val = db_to_linear(float(param_val))
-            success = set_param_value(new_device, param_path, actual_val)
+                actual_val = db_to_linear_str(float(param_val))
+            success, _ = get_and_set_param(new_device, param_path, actual_val)
             if not success:
                 return [f"ERROR: Could not set param '{param_path}' on new {device_tag} for '{track_name}'"]
 
         # Insert into the track's device chain
-        devices_el = track_el.find("DeviceChain/DeviceChain/Devices")
+        devices_el = track_el.find(DEVICES_PATH)
         if devices_el is None:
             return [f"ERROR: No device chain found on track '{track_name}'"]
 
@@ -362,53 +570,68 @@ def apply_change(root, tracks_el, change):
         else:
             devices_el.insert(position, new_device)
             pos_desc = f"position {position}"
+        # The chain changed; drop this track's cached device index, and
+        # re-resolve the donor for this tag next time — the clone may now
+        # be the first matching device in document order.
+        ctx["device_cache"].pop(id(track_el), None)
+        ctx["donor_cache"].pop(device_tag, None)
 
-        param_desc = ", ".join(f"{k}={v}" for k, v in params.items()) if params else "defaults"
-        descriptions.append(f"  {track_name}: Added {device_display} at {pos_desc} ({param_desc})")
+        if verbose:
+            param_desc = ", ".join(f"{k}={v}" for k, v in params.items()) if params else "defaults"
+            descriptions.append(f"  {track_name}: Added {device_display} at {pos_desc} ({param_desc})")
 
     elif target == "group_volume":
         # For group tracks, same as volume but explicitly for groups
         db_val = change.get("value")
-        linear = db_to_linear(db_val)
-        vol_el = mixer.find("Volume/Manual")
-        if vol_el is not None:
-            old_val = float(vol_el.get("Value", "1"))
+        linear = db_to_linear_str(db_val)
+        ok, old = get_and_set_param(mixer, VOLUME_PATH, linear)
+        if ok and verbose:
+            old_val = float(old if old is not None else "1")
             old_db = 20 * math.log10(old_val) if old_val > 0.0003163 else float("-inf")
-            vol_el.set("Value", str(linear))
             descriptions.append(f"  {track_name} (group): Volume {old_db:+.1f} → {db_val:+.1f} dB")
 
     return descriptions
 
 
 def main():
-    if len(sys.argv) < 3 or len(sys.argv) > 4:
-        print("Usage: python3 modify_als.py <input.als> <changes.json> [output.als]", file=sys.stderr)
+    args = [a for a in sys.argv[1:] if a not in ("--quiet", "-q")]
+    verbose = len(args) == len(sys.argv) - 1
+
+    if len(args) < 2 or len(args) > 3:
+        print("Usage: python3 modify_als.py [--quiet] <input.als> <changes.json> [output.als]", file=sys.stderr)
         print("  If output.als is not specified, appends '-modified' to the input filename.", file=sys.stderr)
+        print("  --quiet suppresses per-change output (errors still print).", file=sys.stderr)
         sys.exit(1)
 
-    input_path = sys.argv[1]
-    changes_path = sys.argv[2]
+    input_path = args[0]
+    changes_path = args[1]
 
-    if len(sys.argv) == 4:
-        output_path = sys.argv[3]
+    if len(args) == 3:
+        output_path = args[2]
     else:
         base, ext = os.path.splitext(input_path)
         output_path = f"{base}-modified{ext}"
 
-    # Read the .als file
-    try:
-        with gzip.open(input_path, "rt", encoding="utf-8") as f:
-            xml_content = f.read()
-    except FileNotFoundError:
+    if not os.path.exists(input_path):
         print(f"Error: File not found: {input_path}", file=sys.stderr)
         sys.exit(1)
+
+    # Parse straight from the decompressing stream — no intermediate XML
+    # string, so peak memory is the tree alone, not tree + decoded payload.
+    try:
+        stream, proc = open_als_read(input_path)
+        try:
+            tree = ET.parse(stream, _PARSER)
+        finally:
+            stream.close()
+            if proc is not None:
+                proc.wait()
     except Exception as e:
         print(f"Error reading .als file: {e}", file=sys.stderr)
         sys.exit(1)
 
-    # Parse XML
-    root = ET.fromstring(xml_content)
-    tracks_el = root.find(".//LiveSet/Tracks")
+    root = tree.getroot()
+    tracks_el = root.find(TRACKS_PATH)
     if tracks_el is None:
         print("Error: No Tracks element found", file=sys.stderr)
         sys.exit(1)
@@ -426,13 +649,23 @@ def main():
         print("No changes to apply.", file=sys.stderr)
         sys.exit(0)
 
+    problems = validate_changes(changes)
+    if problems:
+        for problem in problems:
+            print(problem, file=sys.stderr)
+        print(f"\n{len(problems)} invalid change(s); nothing applied.", file=sys.stderr)
+        sys.exit(1)
+
     # Apply changes
-    print(f"Applying {len(changes)} changes...")
+    if verbose:
+        print(f"Applying {len(changes)} changes...")
     all_descriptions = []
     errors = []
 
+    ctx = build_context(root, tracks_el)
+
     for change in changes:
-        result = apply_change(root, tracks_el, change)
+        result = apply_change(root, change, ctx, verbose)
         for desc in result:
             if desc.startswith("ERROR:"):
                 errors.append(desc)
@@ -444,16 +677,21 @@ def main():
     if errors:
         print(f"\n{len(errors)} error(s) occurred.", file=sys.stderr)
 
-    # Write output
-    xml_output = ET.tostring(root, encoding="unicode", xml_declaration=True)
-
-    with gzip.open(output_path, "wt", encoding="utf-8") as f:
-        f.write(xml_output)
-
-    print(f"\nWritten to: {output_path}")
-    print(f"Applied {len(all_descriptions)} changes successfully.")
-    if errors:
-        print(f"{len(errors)} changes failed.")
+    # Serialize straight into the compressor instead of building the whole
+    # output document in memory first.
+    sink, proc = open_als_write(output_path)
+    try:
+        tree.write(sink, encoding="UTF-8", xml_declaration=True)
+    finally:
+        sink.close()
+        if proc is not None:
+            proc.wait()
+
+    if verbose:
+        print(f"\nWritten to: {output_path}")
+        print(f"Applied {len(all_descriptions)} changes successfully.")
+        if errors:
+            print(f"{len(errors)} changes failed.")
 
 
 if __name__ == "__main__":
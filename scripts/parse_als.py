@@ -2,9 +2,22 @@
 """Extract mixing data from Ableton Live Set (.als) files."""
 
 import sys
+import functools
 import gzip
-import math
-import xml.etree.ElementTree as ET
+import io
+from math import inf as _INF, isinf as _isinf, log10 as _log10
+
+try:
+    from lxml import etree as ET
+except ImportError:
+    import xml.etree.ElementTree as ET
+
+try:
+    # ISA-L's vectorized inflate decompresses ~1.2-1.5x faster than zlib;
+    # same API, so it drops straight in when python-isal is installed.
+    from isal import igzip as gzip_mod
+except ImportError:
+    gzip_mod = gzip
 
 # --- Device name mapping ---
 DEVICE_NAMES = {
@@ -134,23 +147,106 @@ DEVICE_PARAMS = {
 
 PLUGIN_TAGS = {"PluginDevice", "AuPluginDevice", "Vst3PluginDevice"}
 
-
+# Interned copies: device dispatch keys dict lookups on element tags, and
+# interning both sides makes those comparisons pointer checks. lxml
+# interns its tag strings already; stdlib ElementTree may not.
+DEVICE_NAMES = {sys.intern(k): v for k, v in DEVICE_NAMES.items()}
+DEVICE_PARAMS = {sys.intern(k): v for k, v in DEVICE_PARAMS.items()}
+PLUGIN_TAGS = frozenset(sys.intern(t) for t in PLUGIN_TAGS)
+
+# Ableton writes booleans as exactly "true"/"false"; membership against
+# these sets replaces per-call str().lower() allocations.
+_TRUE_SET = frozenset({"true", "True", "TRUE"})
+_FALSE_SET = frozenset({"false", "False", "FALSE"})
+
+# Linear amplitudes at or below this render as -inf; just above
+# 10**(-70/20), the value Ableton stores for a fader at the bottom.
+_MIN_AUDIBLE = 0.0003163
+
+# The .als schema is fixed, so every path the extractors evaluate is
+# hoisted here; each one is a single string object, which also keeps
+# stdlib ElementPath's compiled-path cache hitting. All are anchored at
+# the holding element — a ".//" descendant scan from a track walks every
+# device parameter in its subtree just to reach a child at a known depth.
+EFFECTIVE_NAME_PATH = "Name/EffectiveName"
+MIXER_PATH = "DeviceChain/Mixer"
+VOLUME_PATH = "Volume/Manual"
+PAN_PATH = "Pan/Manual"
+SPEAKER_PATH = "Speaker/Manual"
+SEND_MANUAL_PATH = "Send/Manual"
+SEND_ACTIVE_PATH = "Active/Manual"
+OUTPUT_ROUTING_PATH = "DeviceChain/AudioOutputRouting/UpperDisplayString"
+DEVICES_PATH = "DeviceChain/DeviceChain/Devices"
+TEMPO_PATH = "DeviceChain/Mixer/Tempo/Manual"
+MASTER_VOLUME_PATH = "DeviceChain/Mixer/Volume/Manual"
+
+_PLUGIN_NAME_PATHS = (
+    "PluginDesc/VstPluginInfo/PlugName",
+    "PluginDesc/Vst3PluginInfo/Name",
+    "PluginDesc/AuPluginInfo/Name",
+)
+
+# Per-band EQ Eight parameter paths, built once instead of four f-strings
+# per band on every EQ Eight encountered.
+_EQ8_BAND_PATHS = [
+    {key: f"Bands.{i}/ParameterA/{key}" for key in ("IsOn", "Gain", "Freq", "Q", "Mode")}
+    for i in range(8)
+]
+_EQ8_ALT_ON_PATHS = [f"Band{i}On" for i in range(1, 9)]
+
+# Heavy subtrees that carry no mixing data — note payloads, warp markers,
+# automation breakpoints — cleared during parsing to keep memory down.
+_PRUNE_TAGS = frozenset({
+    "AudioClip", "MidiClip", "AutomationEnvelope", "KeyTracks", "WarpMarkers",
+})
+
+
+def load_liveset(stream):
+    """Parse an .als stream into a root element, pruning clip payloads.
+
+    iterparse builds the same tree ET.parse would, but yields each element
+    as it closes; clearing the clip/automation subtrees at that point keeps
+    peak memory near the mixer-and-devices skeleton instead of the whole
+    document, most of which is note and breakpoint data.
+    """
+    root = None
+    for event, elem in ET.iterparse(stream, events=("start", "end")):
+        if event == "start":
+            if root is None:
+                root = elem
+        elif elem.tag in _PRUNE_TAGS:
+            elem.clear()
+    return root
+
+
+@functools.lru_cache(maxsize=1024)
 def vol_to_db(value):
-    """Convert internal volume value to dB."""
+    """Convert internal volume value to dB.
+
+    Cached on the raw attribute string: every untouched send in a set
+    carries the same "0.0003162277571" value, so most conversions — and
+    their float parse and log10 — collapse into dict hits.
+    """
     try:
         v = float(value)
     except (TypeError, ValueError):
         return None
-    if v <= 0.0003163:
-        return float("-inf")
-    return 20 * math.log10(v)
+    if v <= _MIN_AUDIBLE:
+        return -_INF
+    return 20.0 * _log10(v)
 
 
+@functools.lru_cache(maxsize=1024)
 def db_str(db):
-    """Format dB value as string."""
+    """Format dB value as string.
+
+    Cached for the same reason as vol_to_db: most tracks and sends sit at
+    a handful of stock values, so the repeated float formatting collapses
+    into dict hits.
+    """
     if db is None:
         return "N/A"
-    if math.isinf(db) and db < 0:
+    if _isinf(db) and db < 0:
         return "-inf"
     return f"{db:+.1f} dB"
 
@@ -168,45 +264,83 @@ def pan_to_str(value):
     return f"{pos:.0f}{direction}"
 
 
+def _fmt_bool(name, v):
+    return f"{name}: {'on' if v else 'off'}"
+
+
+def _fmt_ratio(name, v):
+    return f"{name}: {v * 100:.0f}%"
+
+
+def _fmt_db(name, v):
+    return f"{name}: {v:.1f} dB"
+
+
+def _fmt_db_linear(name, v):
+    # Stored as linear amplitude, display as dB
+    if v <= _MIN_AUDIBLE:
+        return f"{name}: -inf dB"
+    return f"{name}: {20.0 * _log10(v):.1f} dB"
+
+
+def _fmt_db_utility(name, v):
+    # Utility gain is stored as linear value
+    if v <= _MIN_AUDIBLE:
+        return f"{name}: -inf"
+    return f"{name}: {20.0 * _log10(v):+.1f} dB"
+
+
+def _fmt_ms(name, v):
+    if v >= 1000:
+        return f"{name}: {v / 1000:.1f}s"
+    return f"{name}: {v:.0f}ms"
+
+
+def _fmt_s(name, v):
+    return f"{name}: {v:.2f}s"
+
+
+def _fmt_hz(name, v):
+    if v >= 1000:
+        return f"{name}: {v / 1000:.1f}kHz"
+    return f"{name}: {v:.0f}Hz"
+
+
+def _fmt_pct(name, v):
+    return f"{name}: {v:.0f}%"
+
+
+def _fmt_int(name, v):
+    return f"{name}: {int(v)}"
+
+
+def _fmt_default(name, v):
+    return f"{name}: {v:.2f}"
+
+
+# Per-unit formatters; one dict lookup replaces the chain of string
+# comparisons format_param used to walk for every parameter.
+_FORMATTERS = {
+    "bool": _fmt_bool,
+    "ratio": _fmt_ratio,
+    "dB": _fmt_db,
+    "dB_linear": _fmt_db_linear,
+    "dB_utility": _fmt_db_utility,
+    "ms": _fmt_ms,
+    "s": _fmt_s,
+    "Hz": _fmt_hz,
+    "%": _fmt_pct,
+    "int": _fmt_int,
+}
+
+
 def format_param(name, value, unit):
     """Format a device parameter value."""
     try:
         v = float(value)
     except (TypeError, ValueError):
         return f"{name}: {value}"
-
-    if unit == "bool":
-        return f"{name}: {'on' if v else 'off'}"
-    elif unit == "ratio":
-        return f"{name}: {v * 100:.0f}%"
-    elif unit == "dB":
-        return f"{name}: {v:.1f} dB"
-    elif unit == "dB_linear":
-        # Stored as linear amplitude, display as dB
-        if v <= 0.0003163:
-            return f"{name}: -inf dB"
-        return f"{name}: {20 * math.log10(v):.1f} dB"
-    elif unit == "dB_utility":
-        # Utility gain is stored as linear value
-        if v <= 0.0003163:
-            return f"{name}: -inf"
-        return f"{name}: {20 * math.log10(v):+.1f} dB"
-    elif unit == "ms":
-        if v >= 1000:
-            return f"{name}: {v / 1000:.1f}s"
-        return f"{name}: {v:.0f}ms"
-    elif unit == "s":
-        return f"{name}: {v:.2f}s"
-    elif unit == "Hz":
-        if v >= 1000:
-            return f"{name}: {v / 1000:.1f}kHz"
-        return f"{name}: {v:.0f}Hz"
-    elif unit == "%":
-        return f"{name}: {v:.0f}%"
-    elif unit == "int":
-        return f"{name}: {int(v)}"
-    else:
-        return f"{name}: {v:.2f}"
+    return _FORMATTERS.get(unit, _fmt_default)(name, v)
 
 
 def get_param_value(element, param_name):
@@ -225,11 +359,7 @@ def get_param_value(element, param_name):
 def extract_plugin_name(device_element):
     """Extract third-party plugin name."""
     # Try various paths where plugin names are stored
-    for path in [
-        "PluginDesc/VstPluginInfo/PlugName",
-        "PluginDesc/Vst3PluginInfo/Name",
-        "PluginDesc/AuPluginInfo/Name",
-    ]:
+    for path in _PLUGIN_NAME_PATHS:
         el = device_element.find(path)
         if el is not None:
             name = el.get("Value")
@@ -255,15 +385,16 @@ def extract_eq8_bands(device_element):
     """Extract EQ Eight band info."""
     bands = []
     for i in range(1, 9):
-        band_on = get_param_value(device_element, f"Bands.{i - 1}/ParameterA/IsOn")
+        paths = _EQ8_BAND_PATHS[i - 1]
+        band_on = get_param_value(device_element, paths["IsOn"])
         if band_on is None:
             # Try alternate path
-            band_on = get_param_value(device_element, f"Band{i}On")
-        if band_on and str(band_on).lower() == "true":
-            gain = get_param_value(device_element, f"Bands.{i - 1}/ParameterA/Gain")
-            freq = get_param_value(device_element, f"Bands.{i - 1}/ParameterA/Freq")
-            q = get_param_value(device_element, f"Bands.{i - 1}/ParameterA/Q")
-            mode = get_param_value(device_element, f"Bands.{i - 1}/ParameterA/Mode")
+            band_on = get_param_value(device_element, _EQ8_ALT_ON_PATHS[i - 1])
+        if band_on in _TRUE_SET:
+            gain = get_param_value(device_element, paths["Gain"])
+            freq = get_param_value(device_element, paths["Freq"])
+            q = get_param_value(device_element, paths["Q"])
+            mode = get_param_value(device_element, paths["Mode"])
             mode_int = int(float(mode)) if mode else 3
             mode_label = EQ8_MODES.get(mode_int, "Bell")
             band_info = f"B{i}"
@@ -281,6 +412,65 @@ def extract_eq8_bands(device_element):
     return bands
 
 
+def _handle_plugin(dev, device_info):
+    """Third-party plugin: append the plugin's own name."""
+    plugin_name = extract_plugin_name(dev)
+    if plugin_name:
+        device_info["name"] = f"{device_info['name']}: {plugin_name}"
+
+
+def _handle_stereo_gain(dev, device_info):
+    """Utility special handling — only show non-default params."""
+    gain_val = get_param_value(dev, "Gain")
+    if gain_val is not None:
+        gain_db = vol_to_db(gain_val)
+        if gain_db is not None and abs(gain_db) > 0.05:
+            device_info["params"].append(f"Gain: {db_str(gain_db)}")
+    mute_val = get_param_value(dev, "Mute")
+    if mute_val in _TRUE_SET:
+        device_info["params"].append("Muted")
+    for phase_key, phase_label in [("PhaseInvertL", "Phase Invert L"), ("PhaseInvertR", "Phase Invert R")]:
+        pv = get_param_value(dev, phase_key)
+        if pv in _TRUE_SET:
+            device_info["params"].append(phase_label)
+    ch_mode = get_param_value(dev, "ChannelMode")
+    if ch_mode is not None:
+        mode_names = {0: "Stereo", 1: "Stereo", 2: "Left", 3: "Right", 4: "Swap", 5: "Mono", 6: "Mid", 7: "Side"}
+        mode_int = int(float(ch_mode))
+        if mode_int not in (0, 1):  # only show if not default stereo
+            device_info["params"].append(f"Mode: {mode_names.get(mode_int, mode_int)}")
+    ms_bal = get_param_value(dev, "MidSideBalance")
+    if ms_bal is not None and abs(float(ms_bal) - 1.0) > 0.01:
+        device_info["params"].append(f"M/S Balance: {float(ms_bal):.2f}")
+
+
+def _handle_native(dev, device_info, params_spec):
+    """Generic native device: format the mixing-relevant params."""
+    for param_key, (display_name, unit) in params_spec.items():
+        val = get_param_value(dev, param_key)
+        if val is not None:
+            device_info["params"].append(format_param(display_name, val, unit))
+
+
+def _handle_eq8(dev, device_info):
+    """EQ Eight: global gain plus the active-band summary."""
+    _handle_native(dev, device_info, DEVICE_PARAMS["Eq8"])
+    bands = extract_eq8_bands(dev)
+    if bands:
+        device_info["params"].append(f"Active bands: {', '.join(bands)}")
+
+
+# One dispatch table instead of the plugin/Utility/native/EQ-Eight if
+# chain — a single hash lookup routes each device to its handler.
+_HANDLERS = {tag: _handle_plugin for tag in PLUGIN_TAGS}
+_HANDLERS.update({
+    tag: functools.partial(_handle_native, params_spec=spec)
+    for tag, spec in DEVICE_PARAMS.items()
+})
+_HANDLERS["StereoGain"] = _handle_stereo_gain
+_HANDLERS["Eq8"] = _handle_eq8
+
+
 def extract_devices(devices_element):
     """Extract device chain info."""
     if devices_element is None:
@@ -288,71 +478,46 @@ def extract_devices(devices_element):
 
     devices = []
     for dev in devices_element:
-        tag = dev.tag
+        tag = sys.intern(dev.tag)
         name = DEVICE_NAMES.get(tag, tag)
 
         # Check on/off
         on_val = get_param_value(dev, "On")
-        is_on = on_val is None or str(on_val).lower() == "true"
+        is_on = on_val is None or on_val in _TRUE_SET
 
         device_info = {"tag": tag, "name": name, "on": is_on, "params": []}
 
-        # Third-party plugin name
-        if tag in PLUGIN_TAGS:
-            plugin_name = extract_plugin_name(dev)
-            if plugin_name:
-                device_info["name"] = f"{name}: {plugin_name}"
-
-        # Utility special handling — only show non-default params
-        if tag == "StereoGain":
-            gain_val = get_param_value(dev, "Gain")
-            if gain_val is not None:
-                gain_db = vol_to_db(gain_val)
-                if gain_db is not None and abs(gain_db) > 0.05:
-                    device_info["params"].append(f"Gain: {db_str(gain_db)}")
-            mute_val = get_param_value(dev, "Mute")
-            if mute_val and str(mute_val).lower() == "true":
-                device_info["params"].append("Muted")
-            for phase_key, phase_label in [("PhaseInvertL", "Phase Invert L"), ("PhaseInvertR", "Phase Invert R")]:
-                pv = get_param_value(dev, phase_key)
-                if pv and str(pv).lower() == "true":
-                    device_info["params"].append(phase_label)
-            ch_mode = get_param_value(dev, "ChannelMode")
-            if ch_mode is not None:
-                mode_names = {0: "Stereo", 1: "Stereo", 2: "Left", 3: "Right", 4: "Swap", 5: "Mono", 6: "Mid", 7: "Side"}
-                mode_int = int(float(ch_mode))
-                if mode_int not in (0, 1):  # only show if not default stereo
-                    device_info["params"].append(f"Mode: {mode_names.get(mode_int, mode_int)}")
-            ms_bal = get_param_value(dev, "MidSideBalance")
-            if ms_bal is not None and abs(float(ms_bal) - 1.0) > 0.01:
-                device_info["params"].append(f"M/S Balance: {float(ms_bal):.2f}")
-        # Native device params (non-Utility)
-        elif tag in DEVICE_PARAMS:
-            for param_key, (display_name, unit) in DEVICE_PARAMS[tag].items():
-                val = get_param_value(dev, param_key)
-                if val is not None:
-                    device_info["params"].append(
-                        format_param(display_name, val, unit)
-                    )
-
-        # EQ Eight special handling
-        if tag == "Eq8":
-            bands = extract_eq8_bands(dev)
-            if bands:
-                device_info["params"].append(f"Active bands: {', '.join(bands)}")
+        handler = _HANDLERS.get(tag)
+        if handler is not None:
+            handler(dev, device_info)
 
         devices.append(device_info)
 
     return devices
 
 
-def extract_track(track_element, return_names):
-    """Extract all mixing info from a track element."""
+_TYPE_LABELS = {
+    "AudioTrack": "AUDIO",
+    "MidiTrack": "MIDI",
+    "ReturnTrack": "RETURN",
+    "GroupTrack": "GROUP",
+}
+
+
+def extract_track(track_element, return_names,
+                  _vol_to_db=vol_to_db, _pan_to_str=pan_to_str,
+                  _extract_devices=extract_devices):
+    """Extract all mixing info from a track element.
+
+    The helper functions are bound as defaults so the per-track hot path
+    loads them as locals instead of re-resolving module globals on every
+    call.
+    """
     track_type = track_element.tag
     track_id = track_element.get("Id")
 
     # Name
-    name_el = track_element.find(".//Name/EffectiveName")
+    name_el = track_element.find(EFFECTIVE_NAME_PATH)
     name = name_el.get("Value") if name_el is not None else f"Track {track_id}"
 
     # Group membership
@@ -360,7 +525,7 @@ def extract_track(track_element, return_names):
     group_id = int(group_el.get("Value")) if group_el is not None else -1
 
     # Mixer
-    mixer = track_element.find(".//DeviceChain/Mixer")
+    mixer = track_element.find(MIXER_PATH)
     volume_db = None
     pan_str = "C"
     is_muted = False
@@ -369,32 +534,32 @@ def extract_track(track_element, return_names):
 
     if mixer is not None:
         # Volume
-        vol_el = mixer.find("Volume/Manual")
+        vol_el = mixer.find(VOLUME_PATH)
         if vol_el is not None:
-            volume_db = vol_to_db(vol_el.get("Value"))
+            volume_db = _vol_to_db(vol_el.get("Value"))
 
         # Pan
-        pan_el = mixer.find("Pan/Manual")
+        pan_el = mixer.find(PAN_PATH)
         if pan_el is not None:
-            pan_str = pan_to_str(pan_el.get("Value"))
+            pan_str = _pan_to_str(pan_el.get("Value"))
 
         # Speaker (mute)
-        speaker_el = mixer.find("Speaker/Manual")
+        speaker_el = mixer.find(SPEAKER_PATH)
         if speaker_el is not None:
-            is_muted = speaker_el.get("Value", "true").lower() == "false"
+            is_muted = speaker_el.get("Value") in _FALSE_SET
 
         # Sends
         sends_el = mixer.find("Sends")
         if sends_el is not None:
             for i, sh in enumerate(sends_el):
-                send_val_el = sh.find("Send/Manual")
-                active_el = sh.find("Active/Manual")
-                send_db = vol_to_db(
+                send_val_el = sh.find(SEND_MANUAL_PATH)
+                active_el = sh.find(SEND_ACTIVE_PATH)
+                send_db = _vol_to_db(
                     send_val_el.get("Value") if send_val_el is not None else "0"
                 )
                 is_active = (
                     active_el is None
-                    or active_el.get("Value", "true").lower() == "true"
+                    or active_el.get("Value", "true") in _TRUE_SET
                 )
                 r_name = return_names[i] if i < len(return_names) else f"Return {chr(65 + i)}"
                 sends.append(
@@ -402,119 +567,142 @@ def extract_track(track_element, return_names):
                 )
 
     # Output routing
-    output_el = track_element.find("DeviceChain/AudioOutputRouting/UpperDisplayString")
+    output_el = track_element.find(OUTPUT_ROUTING_PATH)
     if output_el is not None:
         output_routing = output_el.get("Value", "Main")
 
     # Devices
-    devices_el = track_element.find("DeviceChain/DeviceChain/Devices")
-    devices = extract_devices(devices_el)
-
-    type_labels = {
-        "AudioTrack": "AUDIO",
-        "MidiTrack": "MIDI",
-        "ReturnTrack": "RETURN",
-        "GroupTrack": "GROUP",
-    }
+    devices_el = track_element.find(DEVICES_PATH)
+    devices = _extract_devices(devices_el)
+
+    # Sends above -inf, filtered once here so the issue detection and the
+    # formatter both reuse the list instead of re-scanning per track.
+    active_sends = [s for s in sends if s["db"] is not None and s["db"] != -_INF]
 
     return {
-        "type": type_labels.get(track_type, track_type),
+        "type": _TYPE_LABELS.get(track_type, track_type),
         "raw_type": track_type,
         "id": track_id,
+        "id_int": int(track_id) if track_id is not None else -1,
         "name": name,
         "group_id": group_id,
         "volume_db": volume_db,
         "pan": pan_str,
         "muted": is_muted,
         "sends": sends,
+        "active_sends": active_sends,
+        "any_send_on": bool(active_sends),
         "output": output_routing,
         "devices": devices,
     }
 
 
+# Device classes for the heuristics below, keyed on the raw XML tag; set
+# membership replaces substring scans over display names, which could
+# also false-positive on third-party plugin names.
+_EQ_TAGS = frozenset({"Eq8", "ChannelEq"})
+_COMP_TAGS = frozenset({"Compressor2", "GlueCompressor", "MultibandDynamics", "DrumBuss"})
+_LIMITER_TAGS = frozenset({"Limiter"})
+
+
 def detect_issues(tracks, returns, master):
     """Run heuristic checks for common mixing issues."""
     issues = []
-    non_group = [t for t in tracks if t["type"] != "GROUP"]
 
-    if not non_group:
+    # Every aggregate the checks below consume is gathered in a single
+    # pass over the track records (with one nested pass per device list),
+    # instead of one traversal per heuristic.
+    non_group_count = 0
+    zero_count = 0
+    center_count = 0
+    hot = []
+    has_eq = False
+    has_comp = False
+    all_sends_off = True
+    empty = []
+    disabled = []
+    muted = []
+
+    for t in tracks:
+        off_devs = [d["name"] for d in t["devices"] if not d["on"]]
+        if off_devs:
+            disabled.append(f'"{t["name"]}": {", ".join(off_devs)}')
+        if t["muted"]:
+            muted.append(t["name"])
+
+        if t["type"] == "GROUP":
+            continue
+        non_group_count += 1
+
+        v = t["volume_db"]
+        if v is not None:
+            if abs(v) < 0.05:
+                zero_count += 1
+            if v > 3.0:
+                hot.append(t["name"])
+        if t["pan"] == "C":
+            center_count += 1
+
+        for d in t["devices"]:
+            tag = d["tag"]
+            if tag in _EQ_TAGS:
+                has_eq = True
+            elif tag in _COMP_TAGS:
+                has_comp = True
+        if not t["devices"]:
+            empty.append(t["name"])
+
+        if t["sends"] and t["any_send_on"]:
+            all_sends_off = False
+
+    if not non_group_count:
         return issues
 
     # Gain staging: too many tracks at 0.0 dB
-    zero_db = [t for t in non_group if t["volume_db"] is not None and abs(t["volume_db"]) < 0.05]
-    if len(zero_db) > max(2, len(non_group) * 0.6):
+    if zero_count > max(2, non_group_count * 0.6):
         issues.append(
-            f"{len(zero_db)} of {len(non_group)} tracks at 0.0 dB (default fader position — no gain staging)"
+            f"{zero_count} of {non_group_count} tracks at 0.0 dB (default fader position — no gain staging)"
         )
 
     # Stereo spread
-    center = [t for t in non_group if t["pan"] == "C"]
-    if len(center) > max(3, len(non_group) * 0.7) and len(non_group) > 3:
+    if center_count > max(3, non_group_count * 0.7) and non_group_count > 3:
         issues.append(
-            f"{len(center)} of {len(non_group)} tracks panned to center (narrow stereo image)"
+            f"{center_count} of {non_group_count} tracks panned to center (narrow stereo image)"
         )
 
     # No EQ on any track
-    has_eq = any(
-        "EQ" in d["name"] or "Channel EQ" in d["name"]
-        for t in non_group
-        for d in t["devices"]
-    )
-    if not has_eq and len(non_group) > 2:
+    if not has_eq and non_group_count > 2:
         issues.append("No EQ found on any track")
 
     # No compression
-    has_comp = any(
-        "Compressor" in d["name"] or "Glue" in d["name"]
-        for t in non_group
-        for d in t["devices"]
-    )
-    if not has_comp and len(non_group) > 3:
+    if not has_comp and non_group_count > 3:
         issues.append("No compressor found on any track")
 
     # No limiter on master
     if master:
-        has_limiter = any("Limiter" in d["name"] for d in master.get("devices", []))
+        has_limiter = any(d["tag"] in _LIMITER_TAGS for d in master.get("devices", []))
         if not has_limiter:
             issues.append("No limiter on the Main/Master track")
 
     # Sends unused
-    if returns:
-        all_sends_off = all(
-            all(s["db"] is not None and (math.isinf(s["db"]) and s["db"] < 0) for s in t["sends"])
-            for t in non_group
-            if t["sends"]
+    if returns and all_sends_off:
+        issues.append(
+            "Return tracks exist but no sends are active (all at -inf)"
         )
-        if all_sends_off:
-            issues.append(
-                "Return tracks exist but no sends are active (all at -inf)"
-            )
 
     # Hot tracks
-    hot = [t["name"] for t in non_group if t["volume_db"] is not None and t["volume_db"] > 3.0]
     if hot:
         issues.append(f"Tracks above +3 dB (clipping risk): {', '.join(hot)}")
 
     # Empty tracks
-    empty = [
-        t["name"]
-        for t in non_group
-        if not t["devices"]
-    ]
-    if empty and len(empty) < len(non_group):
+    if empty and len(empty) < non_group_count:
         issues.append(f"Tracks with no devices: {', '.join(empty)}")
 
     # Disabled devices
-    disabled = []
-    for t in tracks:
-        off_devs = [d["name"] for d in t["devices"] if not d["on"]]
-        if off_devs:
-            disabled.append(f'"{t["name"]}": {", ".join(off_devs)}')
     if disabled:
         issues.append(f"Disabled devices on: {'; '.join(disabled)}")
 
     # Muted tracks
-    muted = [t["name"] for t in tracks if t["muted"]]
     if muted:
         issues.append(f"Muted tracks: {', '.join(muted)}")
 
@@ -545,8 +733,9 @@ def format_output(project_info, tracks, returns, master, issues):
         f"=== TRACKS ({len(non_group)} tracks, {len(groups)} groups, {len(returns)} returns) ==="
     )
 
-    # Build group map
-    group_map = {int(g["id"]): g["name"] for g in groups}
+    # Build group maps, keyed on the int id cast once during extraction
+    group_map = {g["id_int"]: g["name"] for g in groups}
+    groups_by_id = {g["id_int"]: g for g in groups}
     grouped = {}
     ungrouped = []
 
@@ -567,19 +756,13 @@ def format_output(project_info, tracks, returns, master, issues):
             dev_strs = [format_device(d) for d in t["devices"]]
             lines.append(f"{indent}  Devices: {' -> '.join(dev_strs)}")
         # Show sends that are active (not -inf)
-        active_sends = [
-            s
-            for s in t["sends"]
-            if s["db"] is not None
-            and not (math.isinf(s["db"]) and s["db"] < 0)
-        ]
-        if active_sends:
-            send_strs = [f'{s["name"]}: {db_str(s["db"])}' for s in active_sends]
+        if t["active_sends"]:
+            send_strs = [f'{s["name"]}: {db_str(s["db"])}' for s in t["active_sends"]]
             lines.append(f"{indent}  Sends: {' | '.join(send_strs)}")
 
     # Print groups with their tracks
     for gid, group_name in sorted(group_map.items(), key=lambda x: x[1]):
-        group_track = next((g for g in groups if int(g["id"]) == gid), None)
+        group_track = groups_by_id.get(gid)
         group_vol = db_str(group_track["volume_db"]) if group_track else "N/A"
         lines.append(f'')
         lines.append(f'--- Group: "{group_name}" (Vol: {group_vol}) ---')
@@ -625,13 +808,20 @@ def main():
 
     als_path = sys.argv[1]
 
+    # Binary mode: both parsers decode the payload themselves, and lxml
+    # refuses pre-decoded text that carries an encoding declaration.
     try:
-        with gzip.open(als_path, "rt", encoding="utf-8") as f:
-            tree = ET.parse(f)
+        # Decompress in one shot: a single large inflate beats the parser
+        # pulling small chunks through the decompressor, and the buffer is
+        # released as soon as parsing finishes.
+        with gzip_mod.open(als_path, "rb") as f:
+            data = f.read()
+        root = load_liveset(io.BytesIO(data))
+        del data
     except FileNotFoundError:
         print(f"Error: File not found: {als_path}", file=sys.stderr)
         sys.exit(1)
-    except gzip.BadGzipFile:
+    except (gzip.BadGzipFile, gzip_mod.BadGzipFile):
         print(
             f"Error: Not a valid .als file (not gzip compressed): {als_path}",
             file=sys.stderr,
@@ -641,8 +831,7 @@ def main():
         print(f"Error reading .als file: {e}", file=sys.stderr)
         sys.exit(1)
 
-    root = tree.getroot()
-    liveset = root.find("LiveSet")
+    liveset = root.find("LiveSet") if root is not None else None
     if liveset is None:
         print("Error: No LiveSet found in file", file=sys.stderr)
         sys.exit(1)
@@ -654,7 +843,7 @@ def main():
         master_el = liveset.find("MasterTrack")
     tempo = "?"
     if master_el is not None:
-        tempo_el = master_el.find(".//Mixer/Tempo/Manual")
+        tempo_el = master_el.find(TEMPO_PATH)
         if tempo_el is not None:
             try:
                 tempo = f"{float(tempo_el.get('Value')):.0f}"
@@ -672,7 +861,7 @@ def main():
     return_names = []
     for t in tracks_el:
         if t.tag == "ReturnTrack":
-            name_el = t.find(".//Name/EffectiveName")
+            name_el = t.find(EFFECTIVE_NAME_PATH)
             return_names.append(
                 name_el.get("Value") if name_el is not None else f"Return {chr(65 + len(return_names))}"
             )
@@ -689,8 +878,8 @@ def main():
     # Extract master
     master_info = None
     if master_el is not None:
-        vol_el = master_el.find(".//Mixer/Volume/Manual")
-        master_devices_el = master_el.find("DeviceChain/DeviceChain/Devices")
+        vol_el = master_el.find(MASTER_VOLUME_PATH)
+        master_devices_el = master_el.find(DEVICES_PATH)
         master_info = {
             "volume_db": vol_to_db(vol_el.get("Value")) if vol_el is not None else None,
             "devices": extract_devices(master_devices_el),